@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -19,9 +20,11 @@ class ModuleIssueCode(str, Enum):
 REQUIRED_INIT_KEYS: Dict[str, ModuleIssueCode] = {
     "version": ModuleIssueCode.MISSING_VERSION,
     "type": ModuleIssueCode.MISSING_TYPE,
-    "requirements": ModuleIssueCode.MISSING_REQUIREMENTS,
     "repo_url": ModuleIssueCode.MISSING_REPO_URL,
+    "requirements": ModuleIssueCode.MISSING_REQUIREMENTS,
 }
+# Frozen view of REQUIRED_INIT_KEYS so create_issues walks a tuple, not a dict items view
+REQUIRED_INIT_ITEMS: Tuple[Tuple[str, ModuleIssueCode], ...] = tuple(REQUIRED_INIT_KEYS.items())
 
 # Message templates per issue code (use {key} placeholder)
 ISSUE_MESSAGES: Dict[ModuleIssueCode, str] = {
@@ -43,7 +46,25 @@ ISSUE_MESSAGES: Dict[ModuleIssueCode, str] = {
 }
 
 
-@dataclass
+def _split_key_template(template: str) -> Optional[Tuple[str, ...]]:
+    """Split a template on '{key}' if that is its only placeholder, else return None."""
+    for _, field, spec, conversion in Formatter().parse(template):
+        if field is not None and (field != "key" or spec or conversion):
+            return None
+    if "{{" in template or "}}" in template:
+        return None
+    return tuple(template.split("{key}"))
+
+
+# Pre-split templates so the common '{key}'-only case is a str.join instead of str.format
+_SPLIT_ISSUE_MESSAGES: Dict[ModuleIssueCode, Tuple[str, ...]] = {
+    code: parts
+    for code, template in ISSUE_MESSAGES.items()
+    if (parts := _split_key_template(template)) is not None
+}
+
+
+@dataclass(slots=True)
 class ModuleIssue:
     code: ModuleIssueCode
     message: str
@@ -51,19 +72,23 @@ class ModuleIssue:
 
 
 def create_issue(code: ModuleIssueCode, *, module_path: Path, key: Optional[str] = None) -> ModuleIssue:
-    template = ISSUE_MESSAGES.get(
-        code,
-        "Module reported issue '{code}' for path '{path}'.",
-    )
-    message = template.format(key=key, code=code, path=str(module_path))
+    parts = _SPLIT_ISSUE_MESSAGES.get(code)
+    if parts is not None:
+        message = str(key).join(parts)
+    else:
+        template = ISSUE_MESSAGES.get(
+            code,
+            "Module reported issue '{code}' for path '{path}'.",
+        )
+        message = template.format(key=key, code=code, path=str(module_path))
     return ModuleIssue(code=code, message=message, module_path=module_path)
 
 def create_issues(info: Dict[str, Any], module_path: Path) -> List[ModuleIssue]:
     issues: List[ModuleIssue] = []
-    for key, value in info.items():
-        code = REQUIRED_INIT_KEYS.get(key)
-        if code is None:
-            continue
+    # Absent keys count as missing, so probe the required keys rather than walking info;
+    # the loop stays four iterations no matter how much extra metadata init.yaml carries.
+    for key, code in REQUIRED_INIT_ITEMS:
+        value = info.get(key)
         if isinstance(value, str):
             present = bool(value.strip())
         elif value is None:
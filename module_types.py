@@ -1,9 +1,16 @@
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
 
+def resolve_root_path(root_path: Optional[Path] = None) -> Path:
+    """Return an absolute project root, only walking the filesystem for relative paths."""
+    root = Path(root_path) if root_path else Path.cwd()
+    return root if root.is_absolute() else root.resolve()
+
+
 class ModuleTypeEnum(str, Enum):
     CORE = ("core", "cores")
     MANAGER = ("manager", "managers")
@@ -22,7 +29,11 @@ class ModuleTypeEnum(str, Enum):
         return self._plural
 
 
-@dataclass
+# Plain dict lookup avoids Enum.__call__ overhead when resolving type names
+_TYPE_BY_VALUE: dict[str, ModuleTypeEnum] = {member.value: member for member in ModuleTypeEnum}
+
+
+@dataclass(slots=True)
 class ModuleType:
     enum: ModuleTypeEnum
     name: str
@@ -38,7 +49,8 @@ class ModuleType:
         shows_in_workspace: bool = False,
     ) -> None:
         self.enum = module_type
-        self.name = module_type.value
+        # Interned so name comparisons across modules are pointer-equality fast
+        self.name = sys.intern(module_type.value)
         self.plural_name = plural_name
         self.path = path if path else Path("./" + plural_name)
         self.shows_in_workspace = shows_in_workspace
@@ -48,19 +60,19 @@ class ModuleTypes:
     _instances: dict[Path, "ModuleTypes"] = {}
 
     def __new__(cls, root_path: Optional[Path] = None) -> "ModuleTypes":
-        root = (root_path or Path.cwd()).resolve()
+        root = resolve_root_path(root_path)
         instance = cls._instances.get(root)
         if instance is None:
             instance = super().__new__(cls)
+            instance.root_path = root
             instance._initialized = False
             cls._instances[root] = instance
         return instance
 
     def __init__(self, root_path: Optional[Path] = None) -> None:
-        root = (root_path or Path.cwd()).resolve()
-        if getattr(self, "_initialized", False) and getattr(self, "root_path", None) == root:
+        if self._initialized:
             return
-        self.root_path = root
+        root = self.root_path
         self.module_types: dict[ModuleTypeEnum, ModuleType] = {
             ModuleTypeEnum.CORE: ModuleType(
                 ModuleTypeEnum.CORE,
@@ -96,13 +108,9 @@ class ModuleTypes:
         self._initialized = True
 
     def get_module_type(self, name: ModuleTypeEnum | str) -> ModuleType:
-        if isinstance(name, ModuleTypeEnum):
-            key = name
-        else:
-            try:
-                key = ModuleTypeEnum(name)
-            except ValueError as exc:
-                raise KeyError(f"Module type '{name}' not recognized.") from exc
+        key = name if isinstance(name, ModuleTypeEnum) else _TYPE_BY_VALUE.get(name)
+        if key is None:
+            raise KeyError(f"Module type '{name}' not recognized.")
         return self.module_types[key]
 
     def get_all_types(self) -> list[ModuleType]:
@@ -1,21 +1,106 @@
 from __future__ import annotations
 
-import subprocess
-import sys
+import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
-from utils.logger_util.logger import Logger
-from cores.yaml_reading_core.yaml_reading import YamlReadingCore as YamlReader
-from cores.modules_controller_core.module_types import ModuleType, ModuleTypes
+from functools import cached_property
+from cores.modules_controller_core.module_types import (
+    ModuleType,
+    ModuleTypes,
+    resolve_root_path,
+)
 from cores.modules_controller_core.module_issues import (
     ModuleIssue,
     ModuleIssueCode,
     create_issue,
     create_issues,
 )
-from cores.exceptions_core.adhd_exceptions import ADHDError
+from cores.modules_controller_core.scan_cache import (
+    cache_enabled,
+    drop_cached_init_yaml,
+    fingerprint_module_dirs,
+    load_cached_init_yaml,
+    load_cached_report,
+    store_cached_init_yaml,
+    store_cached_report,
+)
+
+# Logger, YamlReader, yaml, concurrent.futures, subprocess and ADHDError are imported
+# where they are used so that a warm list_all_modules() never pays for them.
+if TYPE_CHECKING:
+    from utils.logger_util.logger import Logger
+
+_UNRESOLVED = object()
+# libyaml-backed loader, looked up on first parse; None when the bindings are unavailable
+_CSafeLoader: Any = _UNRESOLVED
+
+# Initializers are whole subprocesses (pip installs, git clones); keep fan-out modest.
+_INITIALIZER_MAX_WORKERS = min(8, os.cpu_count() or 1)
+# Hidden folders and dunder folders (e.g. __pycache__) are never modules
+_SKIP_PREFIXES = (".", "__")
+
+
+def _parse_init_yaml(f: BinaryIO, init_file: Path) -> Dict[str, Any]:
+    """Parse an already opened init.yaml, preferring the libyaml C loader when available.
+
+    Returns an empty dict for empty or unparsable files, mirroring YamlReader.
+    """
+    global _CSafeLoader
+    if _CSafeLoader is _UNRESOLVED:
+        try:
+            from yaml import CSafeLoader
+        except ImportError:  # reads go through YamlReader instead
+            CSafeLoader = None
+        _CSafeLoader = CSafeLoader
+    if _CSafeLoader is None:
+        from cores.yaml_reading_core.yaml_reading import YamlReadingCore as YamlReader
+        yf = YamlReader.read_yaml(init_file)
+        return yf.to_dict() if yf else {}
+    import yaml
+    try:
+        data = yaml.load(f, Loader=_CSafeLoader)
+    except yaml.YAMLError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_init_yaml(init_file: Path, data: Dict[str, Any]) -> None:
+    """Write init.yaml and seed the parse cache only when the file demonstrably changed."""
+    from cores.yaml_reading_core.yaml_reading import YamlReadingCore as YamlReader
+    try:
+        before = os.stat(init_file)
+    except OSError:
+        before = None
+    written = False
+    try:
+        written = YamlReader.write_yaml(init_file, data) is not False
+    finally:
+        try:
+            after = os.stat(init_file)
+        except OSError:
+            after = None
+        changed = after is not None and (
+            before is None
+            or (after.st_mtime_ns, after.st_size) != (before.st_mtime_ns, before.st_size)
+        )
+        if written and changed:
+            store_cached_init_yaml(init_file, after, data)
+        else:
+            # Never pair a stat stamp with data that may not be what is on disk
+            drop_cached_init_yaml(init_file)
+
+
+def _root_prefix(root_path: Path) -> str:
+    root_str = str(root_path)
+    return root_str if root_str.endswith(os.sep) else root_str + os.sep
+
+
+def _display_path(path: Path, root_prefix: str) -> str:
+    """Path relative to the root prefix when under it, using plain string ops instead of relative_to."""
+    path_str = str(path)
+    return path_str[len(root_prefix):] if path_str.startswith(root_prefix) else path_str
 
 
 class WorkspaceGenerationMode(str, Enum):
@@ -23,7 +108,7 @@ class WorkspaceGenerationMode(str, Enum):
     INCLUDE_ALL = "include_all"
     IGNORE_OVERRIDES = "ignore_overrides"
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     name: str
     version: str
@@ -53,16 +138,19 @@ class ModuleInfo:
         return self.get_instructions_path().exists()
 
 
-@dataclass
+@dataclass(slots=True)
 class ModulesReport:
     modules: List[ModuleInfo] = field(default_factory=list)
     issued_modules: List[ModuleInfo] = field(default_factory=list)
     root_path: Path = Path.cwd()
+    # Maintained by the scan as issues are attached, so printing needs no extra pass
+    total_issues: int = 0
 
     def print_report(self) -> None:
+        from utils.logger_util.logger import Logger
         logger = Logger(name=__class__.__name__)
         total_modules = len(self.modules)
-        total_issues = sum(len(module.issues) for module in self.modules)
+        total_issues = self.total_issues
 
         logger.info(f"Total modules: {total_modules}")
         logger.info(f"Total issues: {total_issues}")
@@ -72,11 +160,9 @@ class ModulesReport:
             return
 
         logger.info("Modules with issues:")
+        root_prefix = _root_prefix(self.root_path)
         for module in self.issued_modules:
-            try:
-                display_path = module.path.relative_to(self.root_path)
-            except ValueError:
-                display_path = module.path
+            display_path = _display_path(module.path, root_prefix)
             logger.info(f"- {module.name} ({module.module_type.name}) -> {display_path}")
             for issue in module.issues:
                 logger.info(f"  [{issue.code}] {issue.message}")
@@ -86,134 +172,185 @@ class ModulesController:
     _instances: dict[Path, "ModulesController"] = {}
     
     def __new__(cls, root_path: Optional[Path] = None) -> "ModulesController":
-        root = (root_path or Path.cwd()).resolve()
+        root = resolve_root_path(root_path)
         instance = cls._instances.get(root)
         if instance is None:
             instance = super().__new__(cls)
+            # __init__ reads root_path from here; ModuleTypes follows the same pattern
+            instance.root_path = root
             instance._initialized = False
             cls._instances[root] = instance
         return instance
     
     def __init__(self, root_path: Optional[Path] = None):
-        root = (root_path or Path.cwd()).resolve()
-        if getattr(self, "_initialized", False) and getattr(self, "root_path", None) == root:
+        if self._initialized:
             return
-        self.root_path = root
-        self.logger = Logger(name=__class__.__name__)
+        root = self.root_path
         self.module_types = ModuleTypes(root_path=root)
+        self._root_prefix = _root_prefix(root)
         self._report: Optional[ModulesReport] = None
         self._initialized = True
     
+    @cached_property
+    def logger(self) -> Logger:
+        from utils.logger_util.logger import Logger
+        return Logger(name=__class__.__name__)
+
     def list_all_modules(self) -> ModulesReport:
-        """Return cached scan results, scanning once if needed."""
+        """Return cached scan results, scanning once if needed.
+
+        A fresh controller first tries the on-disk report cache, which is reused
+        as long as the set of module folders and their init.yaml stats are unchanged.
+        """
         if self._report is None:
-            return self.scan_all_modules()
+            candidates = self._discover_module_dirs()
+            fingerprint = self._fingerprint(candidates)
+            report = load_cached_report(self.root_path, fingerprint)
+            if report is None:
+                return self._scan_modules(candidates, fingerprint)
+            for module in report.modules:
+                module.module_type = self.module_types.get_module_type(module.module_type.enum)
+            self._report = report
         return self._report
 
+    def _discover_module_dirs(self) -> List[Tuple[ModuleType, Path]]:
+        candidates: List[Tuple[ModuleType, Path]] = []
+        for mt in self.module_types.get_all_types():
+            try:
+                with os.scandir(mt.path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                # DirEntry.is_dir() is answered from the readdir buffer, no extra stat
+                if entry.name.startswith(_SKIP_PREFIXES) or not entry.is_dir():
+                    continue
+                candidates.append((mt, mt.path / entry.name))
+        return candidates
+
     def scan_all_modules(self) -> ModulesReport:
         """Scan module type folders and return a report for each discovered module.
 
         A module is any immediate subdirectory of one of the known type roots
         (cores/, managers/, plugins/, utils/, mcps/) that contains an init.yaml.
         """
+        candidates = self._discover_module_dirs()
+        return self._scan_modules(candidates, self._fingerprint(candidates))
+
+    def _fingerprint(self, candidates: List[Tuple[ModuleType, Path]]) -> str:
+        # With caching disabled the report is never stored, so skip the per-module stats
+        if not cache_enabled():
+            return ""
+        return fingerprint_module_dirs(child for _, child in candidates)
+
+    def _scan_modules(self, candidates: List[Tuple[ModuleType, Path]], fingerprint: str) -> ModulesReport:
+        # The fingerprint is taken by the caller before parsing, so edits made mid-scan
+        # invalidate the stored report. Parsing stays serial: the YAML loaders hold the
+        # GIL while building objects, so a thread pool only added handoff overhead.
         modules: List[ModuleInfo] = []
         issued_modules: List[ModuleInfo] = []
-        for mt in self.module_types.get_all_types():
-            base_dir = (mt.path if isinstance(mt.path, Path) else Path(str(mt.path))).resolve()
-            if not base_dir.exists() or not base_dir.is_dir():
-                continue
-            for child in base_dir.iterdir():
-                if not child.is_dir() or child.name.startswith(".") or child.name.startswith("__"):
-                    continue
-                try:
-                    init_data = self.get_module_init_yaml(child)
-                except FileNotFoundError:
-                    init_file = child / "init.yaml"
-                    mi = ModuleInfo(
-                        name=child.name,
-                        version="unknown",
-                        module_type=mt,
-                        path=child,
-                        requirements=[]
-                    )
-                    issue = create_issue(
-                        ModuleIssueCode.MISSING_INIT_YAML,
-                        module_path=init_file,
-                    )
-                    mi.issues.append(issue)
-                    try:
-                        display_path = issue.module_path.relative_to(self.root_path)
-                    except ValueError:
-                        display_path = issue.module_path
-                    self.logger.warning(
-                        f"[{issue.code}] {mi.name}: {issue.message} (file: {display_path})"
-                    )
-                    modules.append(mi)
-                    issued_modules.append(mi)
-                    continue
-
-                name = child.name
-
-                info: Dict[str, Any] = {
-                    "version": init_data.get("version"),
-                    "type": init_data.get("type"),
-                    "repo_url": init_data.get("repo_url"),
-                    "requirements": init_data.get("requirements"),
-                    "shows_in_workspace": init_data.get("shows_in_workspace"),
-                }
-
-                issues = create_issues(info, module_path=child / "init.yaml")
-                requirements_value = info.get("requirements")
-                if not isinstance(requirements_value, list):
-                    requirements_value = []
-
-                # Build module info and collect any issues
+        total_issues = 0
+        for mt, child in candidates:
+            try:
+                init_data = self.get_module_init_yaml(child)
+            except FileNotFoundError:
+                init_file = child / "init.yaml"
                 mi = ModuleInfo(
-                    name=name,
-                    version=str(info["version"]) if info["version"] is not None else "0.0.0",
+                    name=child.name,
+                    version="unknown",
                     module_type=mt,
                     path=child,
-                    repo_url=str(info["repo_url"]) if isinstance(info["repo_url"], str) and info["repo_url"].strip() else None,
-                    requirements=requirements_value,
-                    shows_in_workspace=info["shows_in_workspace"] if isinstance(info["shows_in_workspace"], bool) else None,
-                    issues=issues,
+                    requirements=[]
+                )
+                issue = create_issue(
+                    ModuleIssueCode.MISSING_INIT_YAML,
+                    module_path=init_file,
                 )
-                for issue in issues:
-                    try:
-                        display_path = issue.module_path.relative_to(self.root_path)
-                    except ValueError:
-                        display_path = issue.module_path
-                    self.logger.warning(
-                        f"[{issue.code}] {name}: {issue.message} (file: {display_path})"
-                    )
+                mi.issues.append(issue)
+                self._warn_issues(mi.name, mi.issues)
                 modules.append(mi)
-                if issues:
-                    issued_modules.append(mi)
-                
-        report = ModulesReport(modules=modules, issued_modules=issued_modules, root_path=self.root_path)
+                issued_modules.append(mi)
+                total_issues += 1
+                continue
+
+            name = child.name
+            # Validate straight off the parsed mapping and read each field exactly once
+            issues = create_issues(init_data, module_path=child / "init.yaml")
+            version = init_data.get("version")
+            repo_url = init_data.get("repo_url")
+            requirements = init_data.get("requirements")
+            shows_in_workspace = init_data.get("shows_in_workspace")
+
+            mi = ModuleInfo(
+                name=name,
+                version=str(version) if version is not None else "0.0.0",
+                module_type=mt,
+                path=child,
+                repo_url=repo_url if isinstance(repo_url, str) and repo_url.strip() else None,
+                requirements=requirements if isinstance(requirements, list) else [],
+                shows_in_workspace=shows_in_workspace if isinstance(shows_in_workspace, bool) else None,
+                issues=issues,
+            )
+            modules.append(mi)
+            if issues:
+                self._warn_issues(name, issues)
+                issued_modules.append(mi)
+                total_issues += len(issues)
+            
+        report = ModulesReport(
+            modules=modules,
+            issued_modules=issued_modules,
+            root_path=self.root_path,
+            total_issues=total_issues,
+        )
         self._report = report
+        store_cached_report(self.root_path, fingerprint, report)
         return report
                         
                         
+    def _warn_issues(self, module_name: str, issues: List[ModuleIssue]) -> None:
+        """Log all issues of one module with a single warning call."""
+        issue_lines = [
+            f"[{issue.code}] {module_name}: {issue.message} "
+            f"(file: {_display_path(issue.module_path, self._root_prefix)})"
+            for issue in issues
+        ]
+        self.logger.warning("\n".join(issue_lines))
+
     def get_module_init_yaml(self, module_path: Path) -> Dict[str, Any]:
         """Read init.yaml for a module directory and return its contents as a dict.
 
-        Raises FileNotFoundError if the file is missing or invalid per YamlReader semantics.
+        Raises FileNotFoundError if the file is missing, unreadable (e.g. a directory or
+        permission denied) or invalid per YamlReader semantics. Parsed results are cached
+        on disk per path and validated against mtime and size.
         """
         module_path = Path(module_path)
         init_file = module_path / "init.yaml"
-        yf = YamlReader.read_yaml(init_file)
-        data: Dict[str, Any] = yf.to_dict() if yf else {}
+        # A single open() both probes for the file and feeds the parser; the cache
+        # stamp comes from fstat on the same descriptor.
+        try:
+            f = open(init_file, "rb")
+        except FileNotFoundError:
+            raise
+        except OSError as exc:
+            raise FileNotFoundError(f"Unreadable init.yaml at {init_file}: {exc}") from exc
+        with f:
+            st = os.fstat(f.fileno())
+            cached = load_cached_init_yaml(init_file, st)
+            if cached:
+                return cached
+            data = _parse_init_yaml(f, init_file)
         if not data:
             # Treat empty or invalid data as missing file for callers
             raise FileNotFoundError(f"Invalid or empty init.yaml at {init_file}")
+        store_cached_init_yaml(init_file, st, data)
         return data
 
     def update_module_init_yaml(self, module_path: Path, data: Dict[str, Any]) -> None:
         """Update or create init.yaml for a module directory with the given data."""
         module_path = Path(module_path)
         init_file = module_path / "init.yaml"
-        YamlReader.write_yaml(init_file, data)
+        _write_init_yaml(init_file, data)
 
     def update_module_init_yaml_field(
         self,
@@ -221,19 +358,21 @@ class ModulesController:
         key: str,
         value: Any,
     ) -> None:
-        """Update or create a single field in init.yaml for a module directory."""
+        """Update or create a single field in init.yaml for a module directory.
+
+        The current contents come from the parse cache when it is warm, so batches of
+        field updates only parse the file once.
+        """
         module_path = Path(module_path)
         init_file = module_path / "init.yaml"
         data: Dict[str, Any] = {}
         try:
-            yf = YamlReader.read_yaml(init_file)
-            if yf:
-                data = yf.to_dict()
+            data = self.get_module_init_yaml(module_path)
         except FileNotFoundError:
             pass  # Will create new init.yaml
 
         data[key] = value
-        YamlReader.write_yaml(init_file, data)
+        _write_init_yaml(init_file, data)
 
     def get_module_by_name(self, module_name: str) -> Optional[ModuleInfo]:
         """Find a module by its name (case-insensitive).
@@ -262,6 +401,9 @@ class ModulesController:
         """Execute the __init__.py for a single module if present."""
         if not module.has_initializer():
             return
+        import subprocess
+        import sys
+        from cores.exceptions_core.adhd_exceptions import ADHDError
 
         target_root = Path(project_root).resolve() if project_root else self.root_path
         log = logger or self.logger
@@ -288,6 +430,9 @@ class ModulesController:
         """Execute the refresh.py for a single module if present."""
         if not module.has_refresh_script():
             return
+        import subprocess
+        import sys
+        from cores.exceptions_core.adhd_exceptions import ADHDError
 
         target_root = Path(project_root).resolve() if project_root else self.root_path
         log = logger or self.logger
@@ -310,19 +455,51 @@ class ModulesController:
         *,
         project_root: Optional[Path] = None,
         logger: Optional[Logger] = None,
+        parallel: bool = False,
     ) -> None:
-        """Execute initializers for the provided modules or for all known modules."""
+        """Execute initializers for the provided modules or for all known modules.
+
+        Initializers run one at a time in list order and stop at the first failure.
+        With parallel=True they run concurrently instead: order is no longer kept and
+        output interleaves, and initializers that install into the same environment
+        (e.g. pip) may race, so only opt in for initializers known to be independent.
+        A failure still cancels every initializer that has not started yet.
+        """
         if modules is None:
             modules_to_run = self.list_all_modules().modules
         else:
             modules_to_run = list(modules)
 
-        for module in modules_to_run:
-            self.run_module_initializer(
-                module,
-                project_root=project_root,
-                logger=logger,
-            )
+        if not parallel:
+            for module in modules_to_run:
+                self.run_module_initializer(
+                    module,
+                    project_root=project_root,
+                    logger=logger,
+                )
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        # Resolve the lazy logger up front so worker threads never race on it
+        log = logger or self.logger
+        with ThreadPoolExecutor(max_workers=_INITIALIZER_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    self.run_module_initializer,
+                    module,
+                    project_root=project_root,
+                    logger=log,
+                )
+                for module in modules_to_run
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Fail fast: drop queued initializers, wait only for the running ones
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
     def generate_workspace_file(
         self,
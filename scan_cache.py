@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from cores.modules_controller_core.modules_controller import ModulesReport
+
+try:
+    import msgspec
+except ImportError:  # optional speedup, parse-cache entries fall back to stdlib json
+    msgspec = None
+
+
+# Set ADHD_NO_CACHE=1 (e.g. in CI) to always parse init.yaml files from scratch.
+NO_CACHE_ENV = "ADHD_NO_CACHE"
+
+CACHE_ROOT = Path.home() / ".cache" / "adhd"
+INIT_YAML_CACHE_DIR = CACHE_ROOT / "init_yaml_cache"
+REPORT_CACHE_DIR = CACHE_ROOT / "modules_reports"
+
+# One report is kept per project root; beyond this many roots the least recently used go.
+REPORT_CACHE_MAX_ENTRIES = 32
+# One parse entry is kept per init.yaml path; beyond this many the oldest written go.
+INIT_YAML_CACHE_MAX_ENTRIES = 4096
+# Pruning lists the cache directory, so it only runs once per this many stores.
+INIT_YAML_PRUNE_EVERY = 256
+# Bump whenever ModulesReport/ModuleInfo/ModuleIssue change shape.
+_REPORT_CACHE_VERSION = 3
+
+
+# Parsed init.yaml dicts are plain data, so they are stored with a data-only codec
+# (msgpack via msgspec, else json) rather than pickle.
+if msgspec is not None:
+    _INIT_YAML_SUFFIX = ".msgpack"
+    _encode_init_yaml = msgspec.msgpack.encode
+    _decode_init_yaml = msgspec.msgpack.Decoder(dict).decode
+else:
+    _INIT_YAML_SUFFIX = ".json"
+
+    def _encode_init_yaml(entry: Dict[str, Any]) -> bytes:
+        return json.dumps(entry, separators=(",", ":")).encode()
+
+    _decode_init_yaml = json.loads
+
+
+_init_yaml_stores = 0
+_init_yaml_stores_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(NO_CACHE_ENV, "").strip().lower() not in ("1", "true", "yes")
+
+
+def _init_yaml_cache_file(init_file: Path) -> Path:
+    # Keyed by the absolute path only, so a re-parse after an edit overwrites the old entry
+    raw = os.path.abspath(init_file).encode()
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return INIT_YAML_CACHE_DIR / f"{key}{_INIT_YAML_SUFFIX}"
+
+
+def _stat_stamp(st: os.stat_result) -> list[int]:
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _write_atomic(target: Path, payload: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, target)
+
+
+def load_cached_init_yaml(init_file: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the cached parse of init_file for the given stat result, or None on a miss."""
+    if not cache_enabled():
+        return None
+    try:
+        entry = _decode_init_yaml(_init_yaml_cache_file(init_file).read_bytes())
+    except Exception:
+        # Missing, unreadable or corrupt entries are plain cache misses
+        return None
+    # Any real edit changes mtime or size, which turns the stored entry into a miss
+    if not isinstance(entry, dict) or entry.get("stamp") != _stat_stamp(st):
+        return None
+    data = entry.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def store_cached_init_yaml(init_file: Path, st: os.stat_result, data: Dict[str, Any]) -> None:
+    """Persist a parsed init.yaml; failures are ignored since the cache is best-effort."""
+    if not cache_enabled():
+        return
+    try:
+        entry = {"stamp": _stat_stamp(st), "data": data}
+        payload = _encode_init_yaml(entry)
+        # Skip values the codec cannot reproduce exactly (e.g. YAML dates, non-str keys)
+        if _decode_init_yaml(payload) != entry:
+            return
+        _write_atomic(_init_yaml_cache_file(init_file), payload)
+    except Exception:
+        return
+    global _init_yaml_stores
+    with _init_yaml_stores_lock:
+        _init_yaml_stores += 1
+        due = _init_yaml_stores % INIT_YAML_PRUNE_EVERY == 0
+    if due:
+        _evict_oldest(INIT_YAML_CACHE_DIR, _INIT_YAML_SUFFIX, INIT_YAML_CACHE_MAX_ENTRIES)
+
+
+def drop_cached_init_yaml(init_file: Path) -> None:
+    """Forget the cached parse of init_file so the next read parses it again."""
+    try:
+        os.unlink(_init_yaml_cache_file(init_file))
+    except OSError:
+        pass
+
+
+def fingerprint_module_dirs(module_dirs: Iterable[Path]) -> str:
+    """Digest the module folder listing plus each init.yaml's mtime and size."""
+    digest = hashlib.blake2b(digest_size=16)
+    for module_dir in module_dirs:
+        init_file = module_dir / "init.yaml"
+        try:
+            st = os.stat(init_file)
+            stamp = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            stamp = "-"
+        digest.update(f"{init_file}\0{stamp}\n".encode())
+    return digest.hexdigest()
+
+
+def _report_cache_file(root_path: Path) -> Path:
+    raw = f"{_REPORT_CACHE_VERSION}\0{root_path}".encode()
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return REPORT_CACHE_DIR / f"{key}.pkl"
+
+
+def load_cached_report(root_path: Path, fingerprint: str) -> Optional[ModulesReport]:
+    """Return the stored report for root_path if it was built from the same fingerprint."""
+    if not cache_enabled():
+        return None
+    cache_file = _report_cache_file(root_path)
+    try:
+        payload = pickle.loads(cache_file.read_bytes())
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("fingerprint") != fingerprint:
+        return None
+    try:
+        # Bump mtime so eviction treats this entry as recently used
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return payload.get("report")
+
+
+def store_cached_report(root_path: Path, fingerprint: str, report: ModulesReport) -> None:
+    """Persist a report for root_path and evict the least recently used entries."""
+    if not cache_enabled():
+        return
+    try:
+        payload = pickle.dumps(
+            {"fingerprint": fingerprint, "report": report},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        _write_atomic(_report_cache_file(root_path), payload)
+    except (OSError, pickle.PicklingError):
+        return
+    _evict_oldest(REPORT_CACHE_DIR, ".pkl", REPORT_CACHE_MAX_ENTRIES)
+
+
+def _evict_oldest(cache_dir: Path, suffix: str, max_entries: int) -> None:
+    try:
+        with os.scandir(cache_dir) as it:
+            candidates = [entry for entry in it if entry.name.endswith(suffix)]
+    except OSError:
+        return
+    # Counting names needs no stat; only pay for stats when something must go
+    if len(candidates) <= max_entries:
+        return
+    entries = []
+    for entry in candidates:
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry.path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _, stale in entries[max_entries:]:
+        try:
+            os.unlink(stale)
+        except OSError:
+            pass